@@ -29,7 +29,7 @@ from .types import MissionState
 __all__ = ("Mission", "MissionPlan", "MissionType")
 
 
-class Mission(ModelObject):
+class Mission(ModelObject, metaclass=ABCMeta):
     """Representation of a single mission on the server.
 
     A mission consists of a _type_, an associated set of _parameters_, an
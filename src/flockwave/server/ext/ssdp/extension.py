@@ -192,7 +192,7 @@ async def handle_message(message, sender, *, socket):
         pass
     else:
         if log:
-            log.warning("Unknown SSDP command: {0.command}".format(request))
+            log.warning("Unknown SSDP command: %s", request.command)
 
 
 async def handle_m_search(request, *, socket):
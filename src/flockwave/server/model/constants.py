@@ -1,7 +1,5 @@
 """Constants used in several places throughout the model."""
 
-from __future__ import division
-
 from math import pi
 
 __all__ = (
@@ -4,7 +4,6 @@ server.
 
 from __future__ import annotations
 
-from abc import ABCMeta, abstractproperty
 from contextlib import contextmanager
 from typing import (
     Callable,
@@ -31,20 +30,30 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="ModelObject")
 
 
-class ModelObject(metaclass=ABCMeta):
+class ModelObject:
     """Abstract object that defines the interface of generic objects tracked
     by the Skybrush server.
+
+    The class deliberately does not use ABCMeta so ``isinstance()`` checks
+    against it stay on the fast path of the default metaclass. Subclasses that
+    declare abstract methods of their own should use ABCMeta explicitly.
     """
 
+    __slots__ = ()
+
     @staticmethod
-    def resolve_type(type: str) -> Optional[Type["ModelObject"]]:
+    def resolve_type(
+        type: str, *, _get=_type_registry.get
+    ) -> Optional[Type["ModelObject"]]:
         """Resolves the given model object type specified as a string (as it
         appears in the Flockwave protocol) into the corresponding model object
         class, or `None` if the given type does not map to a model object class.
         """
-        return _type_registry.get(type)
+        # _get is bound at definition time so the lookup is a local variable
+        # access instead of a global lookup followed by an attribute lookup
+        return _get(type)
 
-    @abstractproperty
+    @property
     def device_tree_node(self) -> "Optional[ObjectNode]":
         """Returns the ObjectNode_ that represents the root of the part of the
         device tree that corresponds to the model object, or ``None`` if the
@@ -52,7 +61,7 @@ class ModelObject(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
-    @abstractproperty
+    @property
     def id(self):
         """A unique identifier for the object, assigned at construction time."""
         raise NotImplementedError
@@ -71,7 +80,11 @@ def register(type: str, cls: Type[T]) -> None:
 
 
 def register(
-    type: str, cls: Optional[Type[T]] = None
+    type: str,
+    cls: Optional[Type[T]] = None,
+    *,
+    _contains=_type_registry.__contains__,
+    _setitem=_type_registry.__setitem__,
 ) -> Optional[Callable[[Type[T]], Type[T]]]:
     """Registers a ModelObject_ subclass or factory in the Flockwave messaging
     system with a given type name.
@@ -95,23 +108,28 @@ def register(
         return decorator
 
     else:
-        if type in _type_registry:
+        if _contains(type):
             raise ValueError(f"{repr(type)} is already registered as a type")
-        _type_registry[type] = cls
+        _setitem(type, cls)
 
         return None
 
 
-def unregister(type: str) -> None:
+def unregister(
+    type: str,
+    *,
+    _delitem=_type_registry.__delitem__,
+) -> None:
     """Unregisters a ModelObject_ subclass or factory with the given type name
     from the Flockwave messaging system.
 
     Parameters:
         type: the type name to unregister
     """
-    if type not in _type_registry:
-        raise ValueError(f"{repr(type)} is not registered as a type")
-    del _type_registry[type]
+    try:
+        _delitem(type)
+    except KeyError:
+        raise ValueError(f"{repr(type)} is not registered as a type") from None
 
 
 @contextmanager
@@ -9,8 +9,9 @@ channels, not each individual channel between a client and the server.
 """
 
 from blinker import Signal
-from collections import namedtuple
 from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
 from ..logger import log as base_log
 from ..model import CommunicationChannel
@@ -21,12 +22,29 @@ __all__ = ("ChannelTypeRegistry",)
 log = base_log.getChild("registries.channels")
 
 
-_ChannelTypeDescriptor = namedtuple(
-    "ChannelTypeDescriptor", "id factory address broadcaster ssdp_location"
-)
+@dataclass(frozen=True)
+class ChannelTypeDescriptor:
+    """Descriptor of a single communication channel type in the channel type
+    registry.
+    """
+
+    __slots__ = ("id", "factory", "address", "broadcaster", "ssdp_location")
+
+    id: str
+    factory: Callable[[], CommunicationChannel]
+    address: Optional[Any]
+    broadcaster: Optional[Callable[[Any], Any]]
+    ssdp_location: Optional[Any]
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
 
+    def __setstate__(self, state):
+        # The default implementation would use setattr(), which is forbidden
+        # on frozen dataclasses
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
-class ChannelTypeDescriptor(_ChannelTypeDescriptor):
     def get_address(self, *args, **kwds):
         address = self.address
         if callable(address):
@@ -111,7 +129,7 @@ class ChannelTypeRegistry(RegistryBase[ChannelTypeDescriptor]):
                 channel; the implementation should strive to return an IP
                 address that is on the same subnet as the remote address.
         """
-        if channel_id in self:
+        if channel_id in self._entries:
             return
 
         descriptor = ChannelTypeDescriptor(
@@ -125,8 +143,10 @@ class ChannelTypeRegistry(RegistryBase[ChannelTypeDescriptor]):
 
         log.debug("Channel registered", extra={"id": channel_id})
 
-        self.added.send(self, id=channel_id, descriptor=descriptor)
-        self.count_changed.send(self)
+        if self.added.receivers:
+            self.added.send(self, id=channel_id, descriptor=descriptor)
+        if self.count_changed.receivers:
+            self.count_changed.send(self)
 
     def create_channel_for(self, channel_id):
         """Creates a new communication channel with the type whose ID is
@@ -170,8 +190,10 @@ class ChannelTypeRegistry(RegistryBase[ChannelTypeDescriptor]):
             return
 
         log.debug("Channel deregistered", extra={"id": channel_id})
-        self.count_changed.send(self)
-        self.removed.send(self, id=channel_id, descriptor=descriptor)
+        if self.count_changed.receivers:
+            self.count_changed.send(self)
+        if self.removed.receivers:
+            self.removed.send(self, id=channel_id, descriptor=descriptor)
 
     @contextmanager
     def use(self, name: str, **kwds):
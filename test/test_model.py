@@ -1,5 +1,13 @@
+from pytest import raises
+
 from flockwave.server.model.attitude import Attitude
 from flockwave.server.model.gps import GPSFix, GPSFixType
+from flockwave.server.model.object import (
+    ModelObject,
+    register,
+    registered,
+    unregister,
+)
 from flockwave.server.model.uav import UAVStatusInfo
 
 
@@ -38,3 +46,55 @@ def test_uavstatusinfo():
     status = UAVStatusInfo()
 
     assert status.attitude is None
+
+
+def test_resolve_type_follows_registry_changes():
+    class Dummy(ModelObject):
+        pass
+
+    type = "__dummy__"
+    assert ModelObject.resolve_type(type) is None
+
+    register(type, Dummy)
+    try:
+        assert ModelObject.resolve_type(type) is Dummy
+        assert ModelObject.resolve_type(type) is Dummy
+    finally:
+        unregister(type)
+
+    assert ModelObject.resolve_type(type) is None
+
+
+def test_registered_unregisters_on_exit():
+    class Dummy(ModelObject):
+        pass
+
+    type = "__dummy__"
+    with registered(type, Dummy):
+        assert ModelObject.resolve_type(type) is Dummy
+        with raises(ValueError):
+            with registered(type, Dummy):
+                pass
+        assert ModelObject.resolve_type(type) is Dummy
+
+    assert ModelObject.resolve_type(type) is None
+
+
+def test_registered_does_not_shadow_registered_type():
+    class Registered(ModelObject):
+        pass
+
+    class Temporary(ModelObject):
+        pass
+
+    type = "__dummy__"
+    register(type, Registered)
+    try:
+        with raises(ValueError):
+            with registered(type, Temporary):
+                pass
+        assert ModelObject.resolve_type(type) is Registered
+    finally:
+        unregister(type)
+
+    assert ModelObject.resolve_type(type) is None